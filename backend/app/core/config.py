@@ -6,6 +6,11 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Startup
+    DB_POOL_SIZE: int = 5
+    DB_POOL_WARMUP: int = 5 # Connections opened per worker before serving traffic, 0 disables
+    IMPORT_TIME_BUDGET_SECONDS: float = 2.0 # Warn if importing the app takes longer than this
+
     class Config:
         env_file = ".env"
 
@@ -1,14 +1,22 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import asyncio
+from typing import Optional
+from contextlib import AsyncExitStack
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import QueuePool
 from .config import settings
 
 # Handle SQLite specific args
 connect_args = {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+# SQLite may get a NullPool/StaticPool, which reject pool sizing
+pool_args = {} if "sqlite" in settings.DATABASE_URL else {"pool_size": settings.DB_POOL_SIZE}
 
 engine = create_async_engine(
     settings.DATABASE_URL, 
     echo=True,
-    connect_args=connect_args
+    connect_args=connect_args,
+    **pool_args
 )
 
 SessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
@@ -19,3 +27,25 @@ class Base(DeclarativeBase):
 async def get_db():
     async with SessionLocal() as session:
         yield session
+
+async def warm_pool(engine: AsyncEngine, size: Optional[int] = None) -> None:
+    # Check out `size` connections at once so the pool really opens that many,
+    # then hand them all back. First requests then skip the connect handshake.
+    # Only queue pools keep connections around; warming anything else is a no-op.
+    if not isinstance(engine.pool, QueuePool):
+        return
+    if size is None:
+        size = settings.DB_POOL_WARMUP
+    size = min(size, engine.pool.size())
+    if size <= 0:
+        return
+
+    async with AsyncExitStack() as stack:
+        async def checkout():
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+        # TaskGroup cancels the remaining connects if one fails, so none land on a closed stack
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(size):
+                tg.create_task(checkout())
@@ -0,0 +1,61 @@
+import os
+import logging
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from alembic.util import CommandError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(BACKEND_DIR, "alembic.ini")
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def get_script_directory() -> ScriptDirectory:
+    return ScriptDirectory.from_config(Config(ALEMBIC_INI))
+
+
+def get_head_revision(script: ScriptDirectory) -> str:
+    try:
+        return script.get_current_head()
+    except CommandError as e:
+        raise SchemaOutOfDateError(
+            f"Migration history has more than one head ({', '.join(script.get_heads())}). "
+            "Merge them with `alembic merge heads` before starting the API."
+        ) from e
+
+
+async def check_schema_version(engine: AsyncEngine) -> None:
+    # Only reads the alembic_version row; DDL is applied once via `alembic upgrade head`,
+    # not by every worker on boot.
+    async with engine.connect() as conn:
+        current = await conn.run_sync(lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision())
+
+    script = get_script_directory()
+    head = get_head_revision(script)
+    if current == head:
+        return
+
+    if current is None:
+        raise SchemaOutOfDateError(
+            f"Database has no schema version, expected {head!r}. "
+            "Run `alembic upgrade head` from the backend directory before starting the API."
+        )
+
+    ancestors = {rev.revision for rev in script.walk_revisions(base="base", head=head)}
+    if current in ancestors:
+        raise SchemaOutOfDateError(
+            f"Database schema is at revision {current!r}, behind {head!r}. "
+            "Run `alembic upgrade head` from the backend directory before starting the API."
+        )
+
+    # During a rolling deploy a newer release may already have migrated past this code's head
+    logger.warning(
+        "Database schema is at revision %r, which this release does not know (head %r); assuming it is newer",
+        current, head,
+    )
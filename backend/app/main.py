@@ -1,5 +1,9 @@
+import time
+_import_started = time.perf_counter()
+
 import sys
 import os
+import logging
 
 # Add the parent directory to sys.path to allow running this script directly
 # This ensures 'app' can be imported as a top-level package
@@ -11,13 +15,24 @@ from app.api.api import api_router
 from app.core.config import settings
 
 from contextlib import asynccontextmanager
-from app.core.database import engine, Base
+from app.core.database import engine, warm_pool
+from app.core.migrations import check_schema_version
+
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Schema changes are applied once by `alembic upgrade head` before workers start;
+    # each worker only verifies the revision and pre-opens its pool.
+    await check_schema_version(engine)
+    await warm_pool(engine)
+    if IMPORT_TIME > settings.IMPORT_TIME_BUDGET_SECONDS:
+        logger.warning(
+            "Importing app.main took %.2fs (budget %.2fs); run `python -X importtime -c 'import app.main'` to find slow imports",
+            IMPORT_TIME, settings.IMPORT_TIME_BUDGET_SECONDS,
+        )
     yield
+    await engine.dispose()
 
 app = FastAPI(title="TaskFlow API", lifespan=lifespan)
 
@@ -42,6 +57,8 @@ app.include_router(api_router, prefix="/api/v1")
 def read_root():
     return {"message": "Welcome to TaskFlow API"}
 
+IMPORT_TIME = time.perf_counter() - _import_started
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=True)
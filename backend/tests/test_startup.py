@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import os
+import shutil
+import sqlite3
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from app import main
+from app.core import migrations
+from app.core.database import Base, warm_pool
+from app.core.config import settings
+from app.core.migrations import SchemaOutOfDateError, check_schema_version
+from app.models import user, board  # noqa: F401
+
+EXTRA_REVISION = '''
+revision = "{rev}"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
+'''
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def engine(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def alembic_config(db_path):
+    def make():
+        config = Config(migrations.ALEMBIC_INI)
+        config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{db_path}")
+        return config
+    return make
+
+
+@pytest.fixture
+def script_copy(tmp_path, monkeypatch):
+    # Copy of the real migration scripts the test can add revisions to
+    target = tmp_path / "migrations"
+    shutil.copytree(os.path.join(migrations.BACKEND_DIR, "alembic"), target / "alembic", ignore=shutil.ignore_patterns("__pycache__"))
+    shutil.copy(migrations.ALEMBIC_INI, target / "alembic.ini")
+    monkeypatch.setattr(migrations, "ALEMBIC_INI", str(target / "alembic.ini"))
+
+    def add_revision(rev):
+        (target / "alembic" / "versions" / f"{rev}_extra.py").write_text(EXTRA_REVISION.format(rev=rev))
+    return add_revision
+
+
+def test_missing_schema_version_refuses_to_start(engine):
+    with pytest.raises(SchemaOutOfDateError, match="no schema version"):
+        asyncio.run(check_schema_version(engine))
+
+
+def test_schema_at_head_starts(engine, alembic_config):
+    command.upgrade(alembic_config(), "head")
+    asyncio.run(check_schema_version(engine))
+
+
+def test_schema_behind_head_refuses_to_start(engine, alembic_config, script_copy):
+    command.upgrade(alembic_config(), "head")
+    script_copy("0002")
+    with pytest.raises(SchemaOutOfDateError, match="behind '0002'"):
+        asyncio.run(check_schema_version(engine))
+
+
+def test_schema_ahead_of_head_warns(engine, db_path, caplog):
+    # A newer release has already migrated past the revisions this release knows
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY)")
+        conn.execute("INSERT INTO alembic_version VALUES ('ffff')")
+
+    with caplog.at_level(logging.WARNING, logger="app.core.migrations"):
+        asyncio.run(check_schema_version(engine))
+    assert "'ffff'" in caplog.text
+
+
+def test_multiple_heads_refuses_to_start(engine, alembic_config, script_copy):
+    command.upgrade(alembic_config(), "head")
+    script_copy("0002")
+    script_copy("0003")
+    with pytest.raises(SchemaOutOfDateError, match="more than one head"):
+        asyncio.run(check_schema_version(engine))
+
+
+def test_warm_pool_opens_connections(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=AsyncAdaptedQueuePool, pool_size=3)
+
+    async def run():
+        await warm_pool(engine, size=5)
+        checked_in = engine.pool.checkedin()
+        await engine.dispose()
+        return checked_in
+
+    assert asyncio.run(run()) == 3
+
+
+def test_warm_pool_skips_non_queue_pools(engine):
+    connects = []
+    event.listen(engine.sync_engine, "connect", lambda *args: connects.append(args))
+    asyncio.run(warm_pool(engine, size=5))
+    assert connects == []
+
+
+def test_upgrade_adopts_database_created_before_alembic(engine, alembic_config):
+    # Older releases built the schema with create_all and left no alembic_version row
+    async def create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    asyncio.run(create_all())
+
+    command.upgrade(alembic_config(), "head")
+    asyncio.run(check_schema_version(engine))
+
+
+def test_warm_pool_reads_size_from_settings(db_path, monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_WARMUP", 2)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=AsyncAdaptedQueuePool, pool_size=3)
+
+    async def run():
+        await warm_pool(engine)
+        checked_in = engine.pool.checkedin()
+        await engine.dispose()
+        return checked_in
+
+    assert asyncio.run(run()) == 2
+
+
+class FailingEngine:
+    # First connect fails at once while the others are still in flight
+    def __init__(self, pool):
+        self.pool = pool
+        self.calls = 0
+        self.open = 0
+
+    def connect(self):
+        self.calls += 1
+        return FakeConnection(self, fail=self.calls == 1)
+
+
+class FakeConnection:
+    def __init__(self, engine, fail):
+        self.engine = engine
+        self.fail = fail
+
+    async def __aenter__(self):
+        if self.fail:
+            raise RuntimeError("connect failed")
+        await asyncio.sleep(0.01)
+        self.engine.open += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.engine.open -= 1
+
+    async def execute(self, statement):
+        pass
+
+
+def test_warm_pool_releases_connections_when_one_fails(db_path):
+    real = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=AsyncAdaptedQueuePool, pool_size=3)
+    engine = FailingEngine(real.pool)
+
+    async def run():
+        with pytest.raises(ExceptionGroup):
+            await warm_pool(engine, size=3)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert engine.open == 0
+
+
+@pytest.fixture
+def lifespan_without_db(monkeypatch):
+    async def noop(*args, **kwargs):
+        pass
+    monkeypatch.setattr(main, "check_schema_version", noop)
+    monkeypatch.setattr(main, "warm_pool", noop)
+
+    async def run():
+        async with main.lifespan(main.app):
+            pass
+    return run
+
+
+def test_import_over_budget_warns(lifespan_without_db, monkeypatch, caplog):
+    monkeypatch.setattr(main, "IMPORT_TIME", 3.0)
+    monkeypatch.setattr(settings, "IMPORT_TIME_BUDGET_SECONDS", 2.0)
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        asyncio.run(lifespan_without_db())
+    assert "Importing app.main took 3.00s (budget 2.00s)" in caplog.text
+
+
+def test_import_within_budget_is_quiet(lifespan_without_db, monkeypatch, caplog):
+    monkeypatch.setattr(main, "IMPORT_TIME", 1.0)
+    monkeypatch.setattr(settings, "IMPORT_TIME_BUDGET_SECONDS", 2.0)
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        asyncio.run(lifespan_without_db())
+    assert "Importing app.main" not in caplog.text